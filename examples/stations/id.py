@@ -0,0 +1,18 @@
+"""
+Example: Select weather stations by identifier
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+from meteostat import Stations
+
+# Get weather stations by ICAO code
+stations = Stations()
+stations = stations.id("icao", ["EDDF", "EDDM"])
+
+# Print DataFrame
+print(stations.fetch())
@@ -84,14 +84,13 @@ def load_handler(
             compression="gzip",
             names=columns,
             dtype=types,
-            parse_dates=parse_dates,
+            parse_dates=False if coerce_dates else parse_dates,
         )
 
-        # Force datetime conversion
+        # Force datetime conversion (parsing each column only once)
         if coerce_dates:
-            df.iloc[:, parse_dates] = df.iloc[:, parse_dates].apply(
-                pd.to_datetime, errors="coerce"
-            )
+            for col in parse_dates:
+                df[columns[col]] = pd.to_datetime(df[columns[col]], errors="coerce")
 
     except (FileNotFoundError, HTTPError):
 
@@ -8,14 +8,18 @@ under the terms of the Creative Commons Attribution-NonCommercial
 The code is licensed under the MIT license.
 """
 
+import os
+import time
 from copy import copy
 from datetime import datetime, timedelta
+from multiprocessing.pool import ThreadPool
 from typing import Union
+import numpy as np
 import pandas as pd
 from meteostat.core.cache import get_local_file_path, file_in_cache
 from meteostat.core.loader import load_handler
 from meteostat.interface.base import Base
-from meteostat.utilities.helpers import get_distance
+from meteostat.utilities.helpers import get_distance_radians
 
 
 class Stations(Base):
@@ -27,9 +31,34 @@ class Stations(Base):
     # The cache subdirectory
     cache_subdir: str = "stations"
 
-    # The list of selected weather Stations
+    # The full list of weather Stations
     _data: pd.DataFrame = None
 
+    # Column arrays, identifier indexes and category masks of the full list
+    # (shared with other instances)
+    _arrays: dict = None
+
+    # Mask of selected weather stations (None selects all)
+    _mask: np.ndarray = None
+
+    # Distance of each station to the point passed to nearby()
+    _distance: np.ndarray = None
+
+    # Unit conversions which are applied on fetch
+    _units: tuple = ()
+
+    # The full list of weather stations, shared across instances
+    _master: pd.DataFrame = None
+
+    # Column arrays, identifier indexes and category masks of the shared list
+    _master_arrays: dict = None
+
+    # Settings the shared list was loaded with
+    _master_signature: tuple = None
+
+    # Time at which the shared list was fetched from Meteostat
+    _master_loaded: float = None
+
     # Raw data columns
     _columns: list = [
         "id",
@@ -54,10 +83,10 @@ class Stations(Base):
     _types: dict = {
         "id": "string",
         "name": "object",
-        "country": "string",
-        "region": "string",
-        "wmo": "string",
-        "icao": "string",
+        "country": "category",
+        "region": "category",
+        "wmo": "category",
+        "icao": "category",
         "latitude": "float64",
         "longitude": "float64",
         "elevation": "float64",
@@ -67,11 +96,62 @@ class Stations(Base):
     # Columns for date parsing
     _parse_dates: list = [10, 11, 12, 13, 14, 15]
 
+    @staticmethod
+    def _get_arrays(df: pd.DataFrame) -> dict:
+        """
+        Get NumPy arrays of all columns which are used for filtering
+
+        Category columns map to a tuple of codes and categories. "masks"
+        caches masks of category values. Hash indexes of identifiers
+        ("<organization>_index") are added on first use.
+        """
+
+        arrays = {}
+
+        # Coordinates
+        for col in ("latitude", "longitude"):
+            arrays[col] = df[col].to_numpy(dtype="float64")
+            arrays[col + "_radians"] = np.radians(arrays[col])
+
+        # Cosine of latitude (used for distances)
+        arrays["latitude_cos"] = np.cos(arrays["latitude_radians"])
+
+        # Stations sorted by latitude (used for radius searches)
+        arrays["latitude_order"] = np.argsort(arrays["latitude"], kind="stable")
+        arrays["latitude_sorted"] = arrays["latitude"][arrays["latitude_order"]]
+
+        # Category codes & categories
+        for col in ("country", "region"):
+            categorical = pd.Categorical(df[col])
+            arrays[col] = (categorical.codes, categorical.categories)
+
+        # Cache of category masks
+        arrays["masks"] = {}
+
+        # Inventory as integer nanoseconds (NaT is the smallest int)
+        for col in df.columns[df.columns.str.endswith(("_start", "_end"))]:
+            arrays[col] = df[col].to_numpy(dtype="datetime64[ns]").view("i8")
+
+        return arrays
+
     def _load(self) -> None:
         """
         Load file from Meteostat
         """
 
+        # Settings which affect the loaded data
+        signature = (self.endpoint, self.cache_dir, self.max_age)
+
+        # Reuse the list of stations loaded by a previous instance
+        if (
+            Stations._master is not None
+            and Stations._master_signature == signature
+            and time.time() - Stations._master_loaded <= self.max_age
+        ):
+            self._data = Stations._master
+            self._arrays = Stations._master_arrays
+            return
+
         # File name
         file = "stations/slim.csv.gz"
 
@@ -84,6 +164,9 @@ class Stations(Base):
             # Read cached data
             df = pd.read_pickle(path)
 
+            # Data is as old as the cached file
+            loaded = os.path.getmtime(path)
+
         else:
 
             # Get data from Meteostat
@@ -94,18 +177,139 @@ class Stations(Base):
             # Add index
             df = df.set_index("id")
 
+            # Data is brand new
+            loaded = time.time()
+
             # Save as Pickle
             if self.max_age > 0:
                 df.to_pickle(path)
 
         # Set data
         self._data = df
+        self._arrays = self._get_arrays(df)
+
+        # Share data with future instances
+        if df.index.size > 0:
+            Stations._master = self._data
+            Stations._master_arrays = self._arrays
+            Stations._master_signature = signature
+            Stations._master_loaded = loaded
+
+    def _lookup(self, organization: str) -> pd.Index:
+        """
+        Get hash index of identifiers across all weather stations
+        """
+
+        # Key in arrays of the station list
+        key = organization + "_index"
+
+        # Build index on first use
+        if key not in self._arrays:
+            if organization == "meteostat":
+                values = self._data.index
+            else:
+                values = self._data[organization]
+
+            self._arrays[key] = pd.Index(values.to_numpy(dtype=object))
+
+        return self._arrays[key]
+
+    def _matches(self, column: str, value: str) -> np.ndarray:
+        """
+        Check which weather stations match a category value
+        """
+
+        # Masks of previous queries
+        masks = self._arrays["masks"]
+
+        # Mark mask as recently used
+        if (column, value) in masks:
+            masks[(column, value)] = masks.pop((column, value))
+
+        else:
+            codes, categories = self._arrays[column]
+
+            # Code of the requested value
+            code = categories.get_indexer([value])[0]
+
+            # Unknown values don't match any station (and aren't cached)
+            if code < 0:
+                return np.zeros(len(codes), dtype=bool)
+
+            # Drop the least recently used mask once the cache is full
+            if len(masks) >= 256:
+                del masks[next(iter(masks))]
+
+            # Shared masks must not be changed in place
+            mask = codes == code
+            mask.flags.writeable = False
+            masks[(column, value)] = mask
+
+        return masks[(column, value)]
+
+    def _within_box(self, lat: float, lon: float, radius: int) -> np.ndarray:
+        """
+        Get positions of all weather stations within a radius' bounding box
+        """
+
+        # Angular radius (Earth radius in meters)
+        angle = radius / 6371000
+        dlat = np.degrees(angle)
+
+        # Latitude band (binary search in sorted latitudes)
+        latitude = self._arrays["latitude_sorted"]
+        lower = np.searchsorted(latitude, lat - dlat, "left")
+        upper = np.searchsorted(latitude, lat + dlat, "right")
+        positions = self._arrays["latitude_order"][lower:upper]
+
+        # Longitude band, unless a pole lies within the radius
+        if abs(lat) + dlat < 90:
+            dlon = np.degrees(np.arcsin(np.sin(angle) / np.cos(np.radians(lat))))
+            longitude = self._arrays["longitude"][positions]
+            positions = positions[np.abs((longitude - lon + 180) % 360 - 180) <= dlon]
+
+        return positions
+
+    def _filter(self, mask: np.ndarray) -> "Stations":
+        """
+        Narrow down the selection of weather stations
+        """
+
+        # Create temporal instance
+        temp = copy(self)
+
+        # Combine with current selection
+        temp._mask = mask if temp._mask is None else temp._mask & mask
+
+        # Return class instance
+        return temp
 
     def __init__(self) -> None:
 
         # Get all weather stations
         self._load()
 
+    def id(self, organization: str, code: Union[str, list]) -> "Stations":
+        """
+        Filter weather stations by identifier
+        """
+
+        # Check organization
+        if organization not in ("meteostat", "wmo", "icao"):
+            raise ValueError("Invalid organization")
+
+        # List of identifiers
+        codes = [code] if isinstance(code, str) else list(code)
+
+        # Positions of matching stations
+        positions = self._lookup(organization).get_indexer_for(codes)
+
+        mask = np.zeros(len(self._data.index), dtype=bool)
+        mask[positions[positions >= 0]] = True
+
+        # Return self
+        return self._filter(mask)
+
     def nearby(self, lat: float, lon: float, radius: int = None) -> "Stations":
         """
         Sort/filter weather stations by physical distance
@@ -114,20 +318,59 @@ class Stations(Base):
         # Create temporal instance
         temp = copy(self)
 
-        # Get distance for each station
-        temp._data["distance"] = get_distance(
-            lat, lon, temp._data["latitude"], temp._data["longitude"]
+        # Current selection
+        if temp._mask is None:
+            selected = np.ones(len(temp._data.index), dtype=bool)
+        else:
+            selected = temp._mask
+
+        # Skip stations outside of the radius' bounding box
+        if radius:
+            positions = temp._within_box(lat, lon, radius)
+            positions = positions[selected[positions]]
+
+        else:
+            positions = np.flatnonzero(selected)
+
+        # Coordinates of the remaining stations in radians
+        coordinates = (
+            temp._arrays["latitude_radians"][positions],
+            temp._arrays["longitude_radians"][positions],
+            temp._arrays["latitude_cos"][positions],
         )
 
+        # Point in radians
+        point = (np.radians(lat), np.radians(lon))
+
+        # Number of chunks which are processed in parallel
+        chunks = min(temp.threads, len(positions) // 10000)
+
+        # Get distance for each station
+        if chunks > 1:
+            chunked = zip(*(np.array_split(array, chunks) for array in coordinates))
+            with ThreadPool(chunks) as pool:
+                distance = np.concatenate(
+                    pool.starmap(
+                        get_distance_radians,
+                        [(*point, *chunk) for chunk in chunked],
+                    )
+                )
+
+        else:
+            distance = get_distance_radians(*point, *coordinates)
+
+        temp._distance = np.full(len(selected), np.nan)
+        temp._distance[positions] = distance
+
+        # Previous conversions don't apply to new distances
+        temp._units = tuple(item for item in temp._units if item[0] != "distance")
+
         # Filter by radius
         if radius:
-            temp._data = temp._data[temp._data["distance"] <= radius]
-
-        # Sort stations by distance
-        temp._data.columns.str.strip()
-        temp._data = temp._data.sort_values("distance")
+            temp._mask = np.zeros(len(selected), dtype=bool)
+            temp._mask[positions[distance <= radius]] = True
 
-        # Return self
+        # Return self (stations get sorted by distance on fetch)
         return temp
 
     def region(self, country: str, state: str = None) -> "Stations":
@@ -135,37 +378,36 @@ class Stations(Base):
         Filter weather stations by country/region code
         """
 
-        # Create temporal instance
-        temp = copy(self)
-
         # Country code
-        temp._data = temp._data[temp._data["country"] == country]
+        mask = self._matches("country", country)
 
         # State code
         if state is not None:
-            temp._data = temp._data[temp._data["region"] == state]
+            mask = mask & self._matches("region", state)
 
         # Return self
-        return temp
+        return self._filter(mask)
 
     def bounds(self, top_left: tuple, bottom_right: tuple) -> "Stations":
         """
         Filter weather stations by geographical bounds
         """
 
-        # Create temporal instance
-        temp = copy(self)
+        # Coordinates of all stations
+        latitude = self._arrays["latitude"]
+        longitude = self._arrays["longitude"]
 
-        # Return stations in boundaries
-        temp._data = temp._data[
-            (temp._data["latitude"] <= top_left[0])
-            & (temp._data["latitude"] >= bottom_right[0])
-            & (temp._data["longitude"] <= bottom_right[1])
-            & (temp._data["longitude"] >= top_left[1])
-        ]
+        # Check boundaries, combining conditions in place
+        mask = np.less_equal(latitude, top_left[0])
+        condition = np.greater_equal(latitude, bottom_right[0])
+        mask &= condition
+        np.less_equal(longitude, bottom_right[1], out=condition)
+        mask &= condition
+        np.greater_equal(longitude, top_left[1], out=condition)
+        mask &= condition
 
-        # Return self
-        return temp
+        # Return stations in boundaries
+        return self._filter(mask)
 
     def inventory(
         self, freq: str, required: Union[datetime, tuple, bool] = True
@@ -174,36 +416,29 @@ class Stations(Base):
         Filter weather stations by inventory data
         """
 
-        # Create temporal instance
-        temp = copy(self)
+        # Inventory of all stations
+        start = self._arrays[freq + "_start"]
+        end = self._arrays[freq + "_end"]
 
-        if required is True:
-            # Make sure data exists at all
-            temp._data = temp._data[(pd.isna(temp._data[freq + "_start"]) == False)]
+        # Make sure data exists at all
+        mask = np.not_equal(start, pd.NaT.value)
 
-        elif isinstance(required, tuple):
-            # Make sure data exists across period
-            temp._data = temp._data[
-                (pd.isna(temp._data[freq + "_start"]) == False)
-                & (temp._data[freq + "_start"] <= required[0])
-                & (
-                    temp._data[freq + "_end"] + timedelta(seconds=temp.max_age)
-                    >= required[1]
-                )
-            ]
+        if required is not True:
+            # Period during which data must exist
+            first, last = (
+                required if isinstance(required, tuple) else (required, required)
+            )
 
-        else:
-            # Make sure data exists on a certain day
-            temp._data = temp._data[
-                (pd.isna(temp._data[freq + "_start"]) == False)
-                & (temp._data[freq + "_start"] <= required)
-                & (
-                    temp._data[freq + "_end"] + timedelta(seconds=temp.max_age)
-                    >= required
-                )
-            ]
+            # Earliest accepted end date (allowing for outdated cache)
+            cutoff = pd.Timestamp(last) - timedelta(seconds=self.max_age)
 
-        return temp
+            # Make sure data exists across period
+            condition = np.less_equal(start, pd.Timestamp(first).value)
+            mask &= condition
+            np.greater_equal(end, cutoff.value, out=condition)
+            mask &= condition
+
+        return self._filter(mask)
 
     def convert(self, units: dict) -> "Stations":
         """
@@ -213,10 +448,17 @@ class Stations(Base):
         # Create temporal instance
         temp = copy(self)
 
-        # Change data units
-        for parameter, unit in units.items():
-            if parameter in temp._data.columns.values:
-                temp._data[parameter] = temp._data[parameter].apply(unit)
+        # Available columns
+        columns = list(temp._data.columns)
+        if temp._distance is not None:
+            columns.append("distance")
+
+        # Change data units on fetch
+        temp._units = temp._units + tuple(
+            (parameter, unit)
+            for parameter, unit in units.items()
+            if parameter in columns
+        )
 
         # Return class instance
         return temp
@@ -226,25 +468,59 @@ class Stations(Base):
         Return number of weather stations in current selection
         """
 
-        return len(self._data.index)
+        if self._mask is None:
+            return len(self._data.index)
+
+        return int(np.count_nonzero(self._mask))
 
     def fetch(self, limit: int = None, sample: bool = False) -> pd.DataFrame:
         """
         Fetch all weather stations or a (sampled) subset
         """
 
-        # Copy DataFrame
-        temp = copy(self._data)
+        # Positions of selected stations
+        if self._mask is None:
+            positions = np.arange(len(self._data.index))
+        else:
+            positions = np.flatnonzero(self._mask)
 
         # Return limited number of sampled entries
         if sample and limit:
-            return temp.sample(limit)
+            positions = np.random.choice(positions, limit, replace=False)
+
+        # Sort nearby stations by distance
+        elif self._distance is not None:
+            distance = self._distance[positions]
+
+            # Only sort the closest stations
+            if limit and limit < len(distance):
+                order = np.argpartition(distance, limit - 1)[:limit]
+                order = order[np.argsort(distance[order])]
+
+            else:
+                order = np.argsort(distance)
+
+            positions = positions[order]
 
         # Return limited number of entries
-        if limit:
-            return temp.head(limit)
+        elif limit:
+            positions = positions[:limit]
+
+        # Copy selected entries
+        temp = self._data.take(positions)
+
+        # Add distance
+        if self._distance is not None:
+            temp["distance"] = self._distance[positions]
+
+        # Change data units
+        for parameter, unit in self._units:
+            temp[parameter] = (
+                unit(temp[parameter])
+                if getattr(unit, "vectorized", False)
+                else temp[parameter].apply(unit)
+            )
 
-        # Return all entries
         return temp
 
     # Import additional methods
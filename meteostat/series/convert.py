@@ -22,7 +22,11 @@ def convert(self, units: dict):
     # Change data units
     for parameter, unit in units.items():
         if parameter in temp._columns:
-            temp._data[parameter] = temp._data[parameter].apply(unit)
+            temp._data[parameter] = (
+                unit(temp._data[parameter])
+                if getattr(unit, "vectorized", False)
+                else temp._data[parameter].apply(unit)
+            )
 
     # Return class instance
     return temp
@@ -7,54 +7,90 @@ The code is licensed under the MIT license.
 """
 
 from numpy import NaN, isnan
+from pandas import Series
 
 
+def vectorized(func):
+    """
+    Mark a conversion as safe to apply to an entire Series at once
+    """
+
+    func.vectorized = True
+
+    return func
+
+
+def _round(value, digits: int):
+    """
+    Round a value or an entire Series exactly like round()
+    """
+
+    if not isinstance(value, Series):
+        return round(value, digits)
+
+    rounded = value.round(digits)
+
+    # NumPy may round values next to a tie differently
+    scaled = value * 10**digits
+    ties = abs(scaled % 1 - 0.5) < 1e-6
+    if ties.any():
+        rounded[ties] = [round(float(item), digits) for item in value[ties]]
+
+    return rounded
+
+
+@vectorized
 def fahrenheit(value):
     """
     Convert Celsius to Fahrenheit
     """
 
-    return round((value * 9 / 5) + 32, 1)
+    return _round((value * 9 / 5) + 32, 1)
 
 
+@vectorized
 def kelvin(value):
     """
     Convert Celsius to Kelvin
     """
 
-    return round(value + 273.15, 1)
+    return _round(value + 273.15, 1)
 
 
+@vectorized
 def inches(value):
     """
     Convert millimeters to inches
     """
 
-    return round(value / 25.4, 3)
+    return _round(value / 25.4, 3)
 
 
+@vectorized
 def feet(value):
     """
     Convert meters to feet
     """
 
-    return round(value / 0.3048, 1)
+    return _round(value / 0.3048, 1)
 
 
+@vectorized
 def ms(value):
     """
     Convert kilometers per hour to meters per second
     """
 
-    return round(value / 3.6, 1)
+    return _round(value / 3.6, 1)
 
 
+@vectorized
 def mph(value):
     """
     Convert kilometers per hour to miles per hour
     """
 
-    return round(value * 0.6214, 1)
+    return _round(value * 0.6214, 1)
 
 
 def direction(value):
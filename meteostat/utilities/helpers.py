@@ -15,18 +15,57 @@ def get_distance(lat1, lon1, lat2, lon2) -> float:
     """
     Calculate distance between weather station and geo point
     """
-    # Earth radius in meters
-    radius = 6371000
 
     # Degress to radian
     lat1, lon1, lat2, lon2 = map(np.deg2rad, [lat1, lon1, lat2, lon2])
 
-    # Deltas
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
+    return get_distance_radians(lat1, lon1, lat2, lon2, np.cos(lat2))
+
+
+def get_distance_radians(lat1, lon1, lat2, lon2, cos_lat2) -> float:
+    """
+    Calculate distance between weather station and geo point in radians,
+    using the precomputed cosine of the station's latitude
+    """
+    # Plain arrays (e.g. no Series) so that every step can write in place
+    lat1, lon1, lat2, lon2, cos_lat2 = map(
+        np.asarray, [lat1, lon1, lat2, lon2, cos_lat2]
+    )
+
+    # Earth radius in meters
+    radius = 6371000
+
+    # Output buffers (reused by every step below)
+    shape = np.broadcast(lat1, lon1, lat2, lon2).shape
+    arch = np.empty(shape)
+    buffer = np.empty(shape)
+
+    # Squared sine of the half latitude delta
+    np.subtract(lat2, lat1, out=arch)
+    arch *= 0.5
+    np.sin(arch, out=arch)
+    arch *= arch
+
+    # Squared sine of the half longitude delta, scaled by latitude
+    np.subtract(lon2, lon1, out=buffer)
+    buffer *= 0.5
+    np.sin(buffer, out=buffer)
+    buffer *= buffer
+    buffer *= cos_lat2
+    buffer *= np.cos(lat1)
 
     # Calculate distance
-    arch = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-    arch_sin = 2 * np.arcsin(np.sqrt(arch))
+    arch += buffer
+
+    # Clip rounding errors which would push the arch outside [0, 1]
+    np.clip(arch, 0, 1, out=arch)
+
+    # Central angle (stable for tiny & antipodal distances)
+    np.subtract(1, arch, out=buffer)
+    np.sqrt(buffer, out=buffer)
+    np.sqrt(arch, out=arch)
+    np.arctan2(arch, buffer, out=arch)
+    arch *= 2 * radius
 
-    return radius * arch_sin
+    # Unwrap scalar results
+    return arch[()]
@@ -8,6 +8,18 @@ from datetime import datetime
 from meteostat import Stations, units
 
 
+def test_id():
+    """
+    Test: Stations by identifier
+    """
+
+    # Select weather station by WMO ID
+    station = Stations().id("wmo", "10637").fetch(1).to_dict("records")[0]
+
+    # Check if WMO ID matches Frankfurt Airport
+    assert station["wmo"] == "10637"
+
+
 def test_nearby():
     """
     Test: Nearby stations
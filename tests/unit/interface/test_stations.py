@@ -0,0 +1,184 @@
+"""
+Stations Class Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from meteostat import Stations
+from meteostat.interface import stations
+from meteostat.utilities.helpers import get_distance
+
+
+def load_handler(*_args) -> pd.DataFrame:
+    """
+    Get a small list of weather stations without network access
+    """
+
+    df = pd.DataFrame(
+        {
+            "id": ["10637", "10384", "10865", "72503"],
+            "name": ["Frankfurt", "Berlin", "Munich", "New York"],
+            "country": ["DE", "DE", "DE", "US"],
+            "region": ["HE", "BE", "BY", "NY"],
+            "wmo": ["10637", "10384", "10865", "72503"],
+            "icao": ["EDDF", "EDDT", "EDDM", "KLGA"],
+            "latitude": [50.05, 52.4667, 48.35, 40.7667],
+            "longitude": [8.6, 13.4, 11.7833, -73.8667],
+            "elevation": [111.0, 37.0, 446.0, 9.0],
+            "timezone": ["Europe/Berlin"] * 3 + ["America/New_York"],
+        }
+    )
+
+    for freq in ("hourly", "daily", "monthly"):
+        df[freq + "_start"] = pd.Timestamp("1950-01-01")
+        df[freq + "_end"] = pd.Timestamp("2022-12-31")
+
+    return df.astype({col: "category" for col in ("country", "region", "wmo", "icao")})
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch, tmp_path):
+    """
+    Load the list of weather stations from load_handler() above
+    """
+
+    monkeypatch.setattr(stations, "load_handler", load_handler)
+    monkeypatch.setattr(Stations, "cache_dir", str(tmp_path))
+    monkeypatch.setattr(Stations, "_master", None)
+
+
+def test_id():
+    """
+    Test selection by identifier
+    """
+
+    assert Stations().id("meteostat", "10637").fetch().index.tolist() == ["10637"]
+    assert Stations().id("icao", "EDDT").fetch().index.tolist() == ["10384"]
+
+
+def test_id_missing_code():
+    """
+    Test selection by unknown identifier
+    """
+
+    assert Stations().id("wmo", "99999").count() == 0
+
+
+def test_id_missing_code_in_list():
+    """
+    Test selection by a list of identifiers with an unknown one
+    """
+
+    df = Stations().id("icao", ["EDDM", "XXXX", "EDDF"]).fetch()
+
+    assert df.index.tolist() == ["10637", "10865"]
+
+
+def test_id_after_nearby():
+    """
+    Test selection by identifier keeps stations sorted by distance
+    """
+
+    df = Stations().nearby(52.5, 13.4).id("wmo", ["72503", "10637", "10384"]).fetch()
+
+    assert df.index.tolist() == ["10384", "10637", "72503"]
+
+
+def test_id_invalid_organization():
+    """
+    Test selection by unsupported organization
+    """
+
+    with pytest.raises(ValueError):
+        Stations().id("national", "10637")
+
+
+def load_grid_handler(*_args) -> pd.DataFrame:
+    """
+    Get weather stations on a global 5° grid without network access
+    """
+
+    latitude, longitude = np.meshgrid(np.arange(-90, 91, 5), np.arange(-180, 180, 5))
+
+    df = load_handler().iloc[np.zeros(latitude.size, dtype=int)]
+    df = df.reset_index(drop=True)
+    df["id"] = [f"G{i:04d}" for i in range(latitude.size)]
+    df["latitude"] = latitude.ravel().astype("float64")
+    df["longitude"] = longitude.ravel().astype("float64")
+
+    return df
+
+
+def assert_within_radius(lat: float, lon: float, radius: int) -> None:
+    """
+    Check nearby() against the distance to every weather station
+    """
+
+    df = load_grid_handler()
+    distance = get_distance(
+        lat, lon, df["latitude"].to_numpy(), df["longitude"].to_numpy()
+    )
+
+    result = Stations().nearby(lat, lon, radius).fetch()
+
+    assert sorted(result.index) == sorted(df["id"][distance <= radius])
+
+
+def test_nearby_radius_across_antimeridian(monkeypatch):
+    """
+    Test radius search across ±180° longitude
+    """
+
+    monkeypatch.setattr(stations, "load_handler", load_grid_handler)
+
+    assert_within_radius(10, 178, 1000000)
+    assert_within_radius(-40, -179, 1500000)
+
+
+def test_nearby_radius_polar_cap(monkeypatch):
+    """
+    Test radius search around a pole
+    """
+
+    monkeypatch.setattr(stations, "load_handler", load_grid_handler)
+
+    assert_within_radius(85, 20, 1000000)
+    assert_within_radius(-88, -150, 600000)
+
+
+def test_nearby_radius_beyond_half_earth(monkeypatch):
+    """
+    Test radius search with a radius larger than half the Earth
+    """
+
+    monkeypatch.setattr(stations, "load_handler", load_grid_handler)
+
+    assert_within_radius(30, 60, 15000000)
+    assert_within_radius(-30, 60, 25000000)
+
+
+def test_region():
+    """
+    Test selection by country and region code
+    """
+
+    assert Stations().region("DE", "BY").fetch().index.tolist() == ["10865"]
+    assert Stations().region("US").fetch().index.tolist() == ["72503"]
+
+
+def test_region_missing_code():
+    """
+    Test selection by unknown country code isn't cached
+    """
+
+    selection = Stations().region("XX")
+
+    assert selection.count() == 0
+    assert ("country", "XX") not in selection._arrays["masks"]
@@ -0,0 +1,44 @@
+"""
+Unit Conversion Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import numpy as np
+import pandas as pd
+from meteostat import units
+
+
+def test_vectorized_conversion():
+    """
+    Converting a whole Series matches element-wise conversion exactly
+    """
+
+    # Realistic values with one decimal, including exact ties like 0 °C
+    series = pd.Series(np.append(np.arange(-5000, 10001) / 10, np.nan))
+
+    for unit in (
+        units.fahrenheit,
+        units.kelvin,
+        units.inches,
+        units.feet,
+        units.ms,
+        units.mph,
+    ):
+        assert unit.vectorized
+        pd.testing.assert_series_equal(
+            unit(series), series.apply(unit), check_exact=True, rtol=0, atol=0
+        )
+
+
+def test_scalar_conversion():
+    """
+    Conversions which only support scalar values are not vectorized
+    """
+
+    assert not hasattr(units.direction, "vectorized")
+    assert not hasattr(units.condition, "vectorized")
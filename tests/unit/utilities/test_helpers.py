@@ -0,0 +1,74 @@
+"""
+Helper Utility Tests
+
+Meteorological data provided by Meteostat (https://dev.meteostat.net)
+under the terms of the Creative Commons Attribution-NonCommercial
+4.0 International Public License.
+
+The code is licensed under the MIT license.
+"""
+
+import numpy as np
+import pandas as pd
+from meteostat.utilities.helpers import get_distance, get_distance_radians
+
+
+def test_get_distance():
+    """
+    Distance between Frankfurt and Berlin
+    """
+
+    assert round(get_distance(50.1109, 8.6821, 52.5200, 13.4050) / 1000) == 424
+
+
+def test_get_distance_antipodal():
+    """
+    Distance between antipodal points
+    """
+
+    assert np.isclose(get_distance(0, 0, 0, 180), np.pi * 6371000)
+
+
+def test_get_distance_vectorized():
+    """
+    Distance to multiple points at once
+    """
+
+    distance = get_distance(
+        0, 0, np.array([0.0, 0.0, 90.0]), np.array([0.0, 180.0, 0.0])
+    )
+
+    assert np.allclose(distance, [0, np.pi * 6371000, np.pi / 2 * 6371000])
+
+
+def test_get_distance_series():
+    """
+    Distance to points passed as Pandas Series
+    """
+
+    distance = get_distance(
+        50.1109, 8.6821, pd.Series([52.5200, 48.1351]), pd.Series([13.4050, 11.5820])
+    )
+
+    assert np.allclose(
+        distance,
+        [
+            get_distance(50.1109, 8.6821, 52.5200, 13.4050),
+            get_distance(50.1109, 8.6821, 48.1351, 11.5820),
+        ],
+    )
+
+
+def test_get_distance_radians():
+    """
+    Distance based on radians matches distance based on degrees
+    """
+
+    lat, lon = np.radians([52.5200, 13.4050])
+
+    assert np.isclose(
+        get_distance_radians(
+            np.radians(50.1109), np.radians(8.6821), lat, lon, np.cos(lat)
+        ),
+        get_distance(50.1109, 8.6821, 52.5200, 13.4050),
+    )